@@ -20,6 +20,7 @@ from publiplots.themes.colors import resolve_palette_map
 from publiplots.themes.markers import resolve_marker_map
 from publiplots.themes.linestyles import resolve_linestyle_map
 from publiplots.utils import create_legend_handles, legend
+from publiplots.utils.legend import _attach_legend_data
 
 
 def pointplot(
@@ -488,7 +489,7 @@ def _legend(
 
     # Store metadata on first line for retrieval
     if len(ax.lines) > 0:
-        ax.lines[0]._legend_data = legend_data
+        _attach_legend_data(ax, ax.lines[0], legend_data)
 
     # Create legend using legend() API
     return legend(ax=ax)
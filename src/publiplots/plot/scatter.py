@@ -20,6 +20,7 @@ from publiplots.themes.rcparams import resolve_param
 from publiplots.themes.colors import resolve_palette_map
 from publiplots.themes.markers import resolve_marker_map
 from publiplots.utils import is_categorical, is_numeric, create_legend_handles, legend
+from publiplots.utils.legend import _attach_legend_data
 
 
 def scatterplot(
@@ -563,7 +564,7 @@ def _legend(
 
     # Store metadata on collection
     if len(ax.collections) > 0:
-        ax.collections[0]._legend_data = legend_data
+        _attach_legend_data(ax, ax.collections[0], legend_data)
 
     # Create legends using new legend() API
     builder = legend(ax=ax)
\ No newline at end of file
@@ -17,7 +17,7 @@ import pandas as pd
 
 from publiplots.themes.colors import resolve_palette_map
 from publiplots.utils.transparency import ArtistTracker
-from publiplots.utils.legend import create_legend_handles, legend
+from publiplots.utils.legend import _attach_legend_data, create_legend_handles, legend
 
 
 def swarmplot(
@@ -249,7 +249,7 @@ def _legend(
 
     # Store metadata on collection
     if len(ax.collections) > 0:
-        ax.collections[0]._legend_data = legend_data
+        _attach_legend_data(ax, ax.collections[0], legend_data)
 
     # Create legends using legend() API
     from publiplots.utils.legend import legend as pp_legend
@@ -21,6 +21,7 @@ from publiplots.themes.styles import (
     reset_style,
     get_current_style,
     apply_custom_style,
+    apply_custom_style_scoped,
 )
 
 from publiplots.themes.markers import (
@@ -61,6 +62,7 @@ __all__ = [
     "reset_style",
     "get_current_style",
     "apply_custom_style",
+    "apply_custom_style_scoped",
     # Marker functions
     "resolve_size_map",
     "resolve_markers",
@@ -5,7 +5,8 @@ This module provides carefully curated color palettes optimized for
 publication-ready visualizations, with seamless integration with seaborn.
 """
 
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 from publiplots.themes.rcparams import resolve_param
 from publiplots.utils import is_categorical
@@ -37,6 +38,26 @@ PALETTES = {
 # Functions
 # =============================================================================
 
+@lru_cache(maxsize=16)
+def _named_palette(
+    palette: Union[str, Tuple],
+    n_colors: Optional[int],
+    desat: Optional[float],
+) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Resolve a palette to RGB tuples (internal, memoized).
+
+    ``palette`` is a seaborn/matplotlib palette name, or the tuple of colors
+    of a publiplots palette (see color_palette). Returns an immutable tuple
+    so the cached value cannot be mutated by callers; color_palette() wraps
+    it in a fresh seaborn palette.
+    """
+    import seaborn as sns
+
+    colors = list(palette) if isinstance(palette, tuple) else palette
+    return tuple(sns.color_palette(colors, n_colors=n_colors, desat=desat))
+
+
 def color_palette(palette=None, n_colors=None, desat=None, as_cmap=False):
     """
     Return a color palette as a list of hex colors or colormap.
@@ -80,12 +101,18 @@ def color_palette(palette=None, n_colors=None, desat=None, as_cmap=False):
         palette = resolve_param("palette", "pastel")
 
     # Check publiplots PALETTES first
-    if isinstance(palette, str) and palette in PALETTES:
-        colors = PALETTES[palette]
-        if as_cmap:
-            from matplotlib.colors import ListedColormap
-            return ListedColormap(colors)
-        return sns.color_palette(colors, n_colors=n_colors, desat=desat)
+    if isinstance(palette, str) and palette in PALETTES and as_cmap:
+        from matplotlib.colors import ListedColormap
+        return ListedColormap(PALETTES[palette])
+
+    # Named palettes (publiplots or seaborn) are resolved once and cached.
+    # publiplots palettes are keyed on their current colors, so edits to the
+    # public PALETTES dict are never served from a stale cache entry.
+    if isinstance(palette, str) and not as_cmap:
+        colors = PALETTES.get(palette)
+        if colors is not None:
+            palette = tuple(tuple(c) if isinstance(c, list) else c for c in colors)
+        return sns.color_palette(list(_named_palette(palette, n_colors, desat)))
 
     # Delegate everything else to seaborn
     return sns.color_palette(palette, n_colors=n_colors, desat=desat, as_cmap=as_cmap)
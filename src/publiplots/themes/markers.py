@@ -5,7 +5,11 @@ This module provides standard marker sets and utilities for consistent
 marker usage across visualizations.
 """
 
-from typing import List, Dict, Tuple, Optional, Union
+from itertools import cycle, islice
+from typing import List, Dict, Tuple, Optional, Sequence, Union
+
+import numpy as np
+
 from publiplots.themes.rcparams import resolve_param
 
 
@@ -142,10 +146,11 @@ def resolve_markers(
 
     # Cycle markers if n_markers specified
     if n_markers is not None:
-        markers = [markers[i % len(markers)] for i in range(n_markers)]
-
-    # Reverse if requested
-    if reverse:
+        markers = list(islice(cycle(markers), n_markers))
+        # Reverse if requested (in place: the cycled list is already a copy)
+        if reverse:
+            markers.reverse()
+    elif reverse:
         markers = markers[::-1]
 
     return markers
@@ -167,10 +172,12 @@ def resolve_marker_map(
     Parameters
     ----------
     values : list of str, optional
-        List of category values to map to markers. If None, returns empty dict.
+        List of category values to map to markers. If None and marker_map
+        is not a dict, returns an empty dict.
     marker_map : dict or list, optional
         Marker specification:
-        - dict: Explicit mapping from values to markers (returned as-is)
+        - dict: Explicit mapping from values to markers (returned as-is,
+          even when values is None)
         - list: List of markers to cycle through for values
         - None: Uses default markers from STANDARD_MARKERS
     reverse : bool, default=False
@@ -180,7 +187,7 @@ def resolve_marker_map(
     Returns
     -------
     Dict[str, str]
-        Mapping from category values to marker symbols.
+        Dictionary mapping category values to marker symbols.
 
     Examples
     --------
@@ -210,14 +217,14 @@ def resolve_marker_map(
     --------
     resolve_markers : Resolve markers without creating a mapping
     """
+    # Explicit mapping: cheapest exit, returned as-is
+    if isinstance(marker_map, dict):
+        return marker_map
+
     # Return empty dict if no values provided
     if values is None:
         return {}
 
-    # If already a dict, return as-is
-    if isinstance(marker_map, dict):
-        return marker_map
-
     # Resolve markers and create mapping
     markers = resolve_markers(
         markers=marker_map,
@@ -229,27 +236,33 @@ def resolve_marker_map(
 
 
 def resolve_size_map(
-    values: List[float],
+    values: Union[np.ndarray, Sequence[float]],
     size_range: Optional[Tuple[float, float]] = None,
-    method: str = "linear"
-) -> List[float]:
+    method: str = "linear",
+    value_range: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
     """
     Map data values to marker sizes.
 
     Parameters
     ----------
-    values : List[float]
+    values : array-like of float
         Data values to map.
     size_range : Tuple[float, float], optional
         (min_size, max_size) in points^2. If None, reads from rcParams
         ('scatter.size_min', 'scatter.size_max').
     method : str, default='linear'
-        Mapping method: 'linear' or 'log'.
+        Mapping method: 'linear' or 'log' (log1p-scaled).
+    value_range : Tuple[float, float], optional
+        (v_min, v_max) data values mapped to (min_size, max_size), in the
+        same units as ``values``. If None, computed from ``values``. Pass
+        it to share one scale across several plots (e.g. facets) and to
+        skip the min/max reductions.
 
     Returns
     -------
-    List[float]
-        Mapped marker sizes.
+    np.ndarray
+        Mapped marker sizes (1-D float array, usable directly as ``s=``).
 
     Examples
     --------
@@ -260,10 +273,12 @@ def resolve_size_map(
 
     Use default size range from rcParams:
     >>> sizes = resolve_size_map(neg_log_p)
-    """
-    import numpy as np
 
-    values = np.array(values)
+    Share one scale across facets:
+    >>> value_range = (min(neg_log_p), max(neg_log_p))
+    >>> sizes = resolve_size_map(facet_values, value_range=value_range)
+    """
+    values = np.asarray(values, dtype=np.float64)
 
     # Get size range from rcParams if not provided
     if size_range is None:
@@ -273,24 +288,26 @@ def resolve_size_map(
 
     min_size, max_size = size_range
 
-    if method == "linear":
-        # Linear scaling
-        v_min, v_max = values.min(), values.max()
-        if v_max == v_min:
-            return [min_size] * len(values)
-        normalized = (values - v_min) / (v_max - v_min)
-        sizes = min_size + normalized * (max_size - min_size)
-
-    elif method == "log":
-        # Log scaling
-        log_values = np.log10(values + 1)  # Add 1 to avoid log(0)
-        v_min, v_max = log_values.min(), log_values.max()
-        if v_max == v_min:
-            return [min_size] * len(values)
-        normalized = (log_values - v_min) / (v_max - v_min)
-        sizes = min_size + normalized * (max_size - min_size)
-
-    else:
+    # Scratch buffer owned by this function (None: input must not be mutated)
+    out = None
+    if method == "log":
+        # Log scaling (log1p avoids log(0) in a single ufunc call)
+        values = out = np.log1p(values)
+    elif method != "linear":
         raise ValueError(f"Unknown method '{method}'. Use 'linear' or 'log'.")
 
-    return sizes.tolist()
+    if value_range is None:
+        v_min, v_max = values.min(), values.max()
+    else:
+        v_min, v_max = value_range
+        if method == "log":
+            v_min, v_max = np.log1p(v_min), np.log1p(v_max)
+    if v_max == v_min:
+        return np.full_like(values, min_size)
+
+    # min_size + (values - v_min) * scale, fused into a single output buffer
+    scale = (max_size - min_size) / (v_max - v_min)
+    sizes = np.subtract(values, v_min, out=out)
+    np.multiply(sizes, scale, out=sizes)
+    np.add(sizes, min_size, out=sizes)
+    return sizes
@@ -12,15 +12,17 @@ Main components:
 - resolve_param(): Helper for parameter resolution
 """
 
-from typing import Dict, Any, Optional
-import matplotlib.pyplot as plt
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from matplotlib import RcParams, rcParamsDefault
+from matplotlib import rcParams as rcParams_mpl
 
 
 # =============================================================================
 # Base Default Dictionaries
 # =============================================================================
 
-MATPLOTLIB_RCPARAMS: Dict[str, Any] = {
+MATPLOTLIB_RCPARAMS: Mapping[str, Any] = MappingProxyType({
     # Figure settings - compact by default (publication-ready)
     "figure.figsize": [3, 1.8],
     "figure.dpi": 600,
@@ -95,16 +97,17 @@ MATPLOTLIB_RCPARAMS: Dict[str, Any] = {
     # PDF settings for vector graphics
     "pdf.fonttype": 42,
     "ps.fonttype": 42,
-}
+})
 """
 Base matplotlib rcParams defaults.
 
 These are the fundamental matplotlib parameter values shared across all styles.
 Individual styles (notebook, publication) compose these with their overrides.
+Read-only: change parameters through pp.rcParams instead.
 """
 
 
-PUBLIPLOTS_RCPARAMS: Dict[str, Any] = {
+PUBLIPLOTS_RCPARAMS: Mapping[str, Any] = MappingProxyType({
     # Color and transparency
     "color": "#5d83c3",  # Default blue
     "alpha": 0.1,  # Default transparency for bars
@@ -121,18 +124,37 @@ PUBLIPLOTS_RCPARAMS: Dict[str, Any] = {
     # Scatter plot sizes
     "scatter.size_min": 50,  # Minimum marker size for size mapping
     "scatter.size_max": 1000,  # Maximum marker size for size mapping
-}
+})
 """
 PubliPlots custom rcParams.
 
 These are publiplots-specific parameters not part of matplotlib's rcParams.
 They can be accessed via pp.rcParams just like matplotlib parameters.
+Read-only: the current values live in the module-level mutable store.
 """
 
 
+# MATPLOTLIB_RCPARAMS converted once to the canonical form matplotlib's
+# validators produce (e.g. "font.family" -> ["sans-serif"]), so init can
+# write values directly without re-running the validators on every call
+_validated = RcParams(MATPLOTLIB_RCPARAMS)
+_MATPLOTLIB_RCPARAMS_VALIDATED: Dict[str, Any] = {
+    key: _validated._get(key) for key in _validated
+}
+del _validated
+
+
 # Module-level mutable storage for custom parameters
 # This gets updated by styles and user modifications
-_PUBLIPLOTS_CUSTOM_DEFAULTS: Dict[str, Any] = PUBLIPLOTS_RCPARAMS.copy()
+_PUBLIPLOTS_CUSTOM_DEFAULTS: Dict[str, Any] = dict(PUBLIPLOTS_RCPARAMS)
+
+# Fixed set of publiplots parameter names, used to route lookups/writes
+# without touching matplotlib's (validating) rcParams for custom keys
+_CUSTOM_KEYS = frozenset(PUBLIPLOTS_RCPARAMS)
+
+
+# Sentinel for single-lookup dict access (distinguishes missing keys from None)
+_MISSING = object()
 
 
 # =============================================================================
@@ -161,13 +183,15 @@ def _get_default(key: str) -> Any:
     KeyError
         If parameter not found in either custom or matplotlib params
     """
-    # Check custom params first
-    if key in _PUBLIPLOTS_CUSTOM_DEFAULTS:
-        return _PUBLIPLOTS_CUSTOM_DEFAULTS[key]
+    # Custom params never reach matplotlib's rcParams
+    if key in _CUSTOM_KEYS:
+        value = _PUBLIPLOTS_CUSTOM_DEFAULTS.get(key, _MISSING)
+        return value if value is not _MISSING else PUBLIPLOTS_RCPARAMS[key]
 
     # Then check matplotlib rcParams
-    if key in plt.rcParams:
-        return plt.rcParams[key]
+    value = rcParams_mpl.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
 
     raise KeyError(f"Parameter '{key}' not found in publiplots or matplotlib rcParams")
 
@@ -246,26 +270,26 @@ class PubliplotsRcParams:
     def get(self, key: str, default: Any = None) -> Any:
         """Get parameter value with optional fallback."""
         try:
-            return self[key]
+            return _get_default(key)
         except KeyError:
             return default
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Set parameter value."""
-        if key in PUBLIPLOTS_RCPARAMS:
+        if key in _CUSTOM_KEYS:
             # Custom publiplots parameter
             _PUBLIPLOTS_CUSTOM_DEFAULTS[key] = value
         else:
             # Matplotlib parameter
-            plt.rcParams[key] = value
+            rcParams_mpl[key] = value
 
     def __contains__(self, key: str) -> bool:
         """Check if parameter exists."""
-        return key in _PUBLIPLOTS_CUSTOM_DEFAULTS or key in plt.rcParams
+        return key in _CUSTOM_KEYS or key in rcParams_mpl
 
     def keys(self):
         """Return all parameter keys."""
-        return list(_PUBLIPLOTS_CUSTOM_DEFAULTS.keys()) + list(plt.rcParams.keys())
+        return list(_PUBLIPLOTS_CUSTOM_DEFAULTS.keys()) + list(rcParams_mpl.keys())
 
 
 # =============================================================================
@@ -304,11 +328,16 @@ def init_rcparams() -> None:
     >>> import publiplots as pp
     >>> pp.themes.rcparams.init_rcparams()
     """
-    for key, value in MATPLOTLIB_RCPARAMS.items():
+    rc = rcParams_mpl
+    for key, value in _MATPLOTLIB_RCPARAMS_VALIDATED.items():
         # Only set if key doesn't exist or is at matplotlib default
         # This preserves user customizations made before import
-        if key not in plt.rcParams or plt.rcParams[key] == plt.rcParamsDefault.get(key):
-            plt.rcParams[key] = value
+        if key not in rc or rc._get(key) == rcParamsDefault._get(key):
+            # Values are pre-validated: bypass RcParams.__setitem__ validation.
+            # Lists are copied so in-place edits to rcParams don't leak back.
+            if isinstance(value, list):
+                value = value.copy()
+            rc._set(key, value)
 
 
 # Initialize on import
@@ -11,8 +11,10 @@ Two main styles:
 Styles are composed from base defaults plus style-specific overrides.
 """
 
-from typing import Dict, Any
-import matplotlib.pyplot as plt
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping, Tuple
+import matplotlib as mpl
 
 from .rcparams import (
     MATPLOTLIB_RCPARAMS,
@@ -26,7 +28,7 @@ from .rcparams import (
 # =============================================================================
 
 # Notebook style: base defaults + larger sizes for interactive work
-NOTEBOOK_STYLE = {
+NOTEBOOK_STYLE: Mapping[str, Any] = MappingProxyType({
     **MATPLOTLIB_RCPARAMS,
     **PUBLIPLOTS_RCPARAMS,
     # Overrides for notebook/interactive work
@@ -44,7 +46,7 @@ NOTEBOOK_STYLE = {
     "lines.markersize": 6,
     "lines.markeredgewidth": 2.0,
     "patch.linewidth": 2.0,
-}
+})
 """
 Notebook-ready style optimized for interactive work and exploration.
 
@@ -57,7 +59,7 @@ Features:
 """
 
 # Publication style: base defaults + compact publication settings
-PUBLICATION_STYLE = {
+PUBLICATION_STYLE: Mapping[str, Any] = MappingProxyType({
     **MATPLOTLIB_RCPARAMS,
     **PUBLIPLOTS_RCPARAMS,
     # Overrides for publication
@@ -68,14 +70,14 @@ PUBLICATION_STYLE = {
     "ytick.major.width": 0.75,
     "figure.dpi": 600,
     "savefig.dpi": 600,
-}
+})
 """
 Publication-ready style optimized for final publication figures.
 
 Features:
 - Small fonts (8pt base) for compact figures
 - High DPI (600) for print quality
-- Compact figure size (3×2) for publications
+- Compact figure size (3×1.8) for publications
 - Clean, minimal styling
 - Perfect for creating figures for papers or Adobe Illustrator
 """
@@ -85,30 +87,57 @@ Features:
 # Helper Functions
 # =============================================================================
 
-def _apply_style(style_dict: Dict[str, Any]) -> None:
+def _split_style(
+    style_dict: Mapping[str, Any]
+) -> Tuple[Mapping[str, Any], Mapping[str, Any]]:
     """
-    Apply a complete style (both matplotlib and publiplots params).
+    Split a complete style into matplotlib and publiplots parameters.
 
     Parameters
     ----------
-    style_dict : dict
+    style_dict : Mapping
         Complete style dictionary containing both matplotlib rcParams
         and publiplots-specific parameters.
+
+    Returns
+    -------
+    Tuple[Mapping[str, Any], Mapping[str, Any]]
+        Read-only (matplotlib_params, publiplots_params).
     """
-    # Separate matplotlib params from publiplots params
     matplotlib_params = {
         k: v for k, v in style_dict.items() if k not in PUBLIPLOTS_RCPARAMS
     }
     publiplots_params = {
         k: v for k, v in style_dict.items() if k in PUBLIPLOTS_RCPARAMS
     }
+    return MappingProxyType(matplotlib_params), MappingProxyType(publiplots_params)
+
+
+def _apply_style(
+    matplotlib_params: Mapping[str, Any],
+    publiplots_params: Mapping[str, Any],
+) -> None:
+    """
+    Apply a complete style (both matplotlib and publiplots params).
 
+    Parameters
+    ----------
+    matplotlib_params : dict
+        Matplotlib rcParams, applied in a single rcParams.update() call.
+    publiplots_params : dict
+        Publiplots-specific parameters.
+    """
     # Apply to respective stores
-    plt.rcParams.update(matplotlib_params)
+    mpl.rcParams.update(matplotlib_params)
     _PUBLIPLOTS_CUSTOM_DEFAULTS.clear()
     _PUBLIPLOTS_CUSTOM_DEFAULTS.update(publiplots_params)
 
 
+# Styles are split once at import instead of on every set_*_style() call
+_NOTEBOOK_PARAMS = _split_style(NOTEBOOK_STYLE)
+_PUBLICATION_PARAMS = _split_style(PUBLICATION_STYLE)
+
+
 # =============================================================================
 # Public Style Functions
 # =============================================================================
@@ -131,20 +160,20 @@ def set_notebook_style() -> None:
     >>> fig, ax = pp.barplot(data=df, x='x', y='y')  # Uses notebook defaults
 
     Check current parameters:
-    >>> pp.rcParams['font.size']  # 11
+    >>> pp.rcParams['font.size']  # 12
     >>> pp.rcParams['alpha']  # 0.1
     >>> pp.rcParams['figure.figsize']  # [6.0, 4.0]
 
     Notes
     -----
     This style sets:
-    - Font size: 11pt (readable on screens)
+    - Font size: 12pt (readable on screens)
     - Figure size: 6×4 inches
     - DPI: 300 (good quality for screens)
     - Line width: 2.0 (thicker for visibility)
     - All publiplots params: color, alpha, capsize, palette, hatch_mode
     """
-    _apply_style(NOTEBOOK_STYLE)
+    _apply_style(*_NOTEBOOK_PARAMS)
 
 
 def set_publication_style() -> None:
@@ -167,21 +196,21 @@ def set_publication_style() -> None:
 
     Check current parameters:
     >>> pp.rcParams['font.size']  # 8
-    >>> pp.rcParams['alpha']  # 0.15
-    >>> pp.rcParams['figure.figsize']  # [3.5, 2.5]
+    >>> pp.rcParams['alpha']  # 0.1
+    >>> pp.rcParams['figure.figsize']  # [3.0, 1.8]
     >>> pp.rcParams['savefig.dpi']  # 600
 
     Notes
     -----
     This style sets:
     - Font size: 8pt (compact for publications)
-    - Figure size: 3.5×2.5 inches (fits journal columns)
+    - Figure size: 3×1.8 inches (fits journal columns)
     - DPI: 600 (print quality)
-    - Line width: 1.2 (appropriate for small plots)
-    - Alpha: 0.15 (more visible on compact figures)
+    - Line width: 1.0 (appropriate for small plots)
+    - Alpha: 0.1 (transparent fill with opaque edges)
     - All publiplots params: color, capsize, palette, hatch_mode
     """
-    _apply_style(PUBLICATION_STYLE)
+    _apply_style(*_PUBLICATION_PARAMS)
 
 
 def reset_style() -> None:
@@ -198,7 +227,7 @@ def reset_style() -> None:
     >>> # ... create plots ...
     >>> pp.reset_style()  # Reset to matplotlib defaults
     """
-    plt.rcdefaults()
+    mpl.rcdefaults()
 
 
 def get_current_style() -> Dict[str, Any]:
@@ -221,7 +250,13 @@ def get_current_style() -> Dict[str, Any]:
     >>> print(current['font.size'])
     8
     """
-    return dict(plt.rcParams)
+    # Read the stored values with RcParams._get instead of going through
+    # RcParams.__getitem__ per key (RcParams iterates in sorted key order);
+    # "backend" is re-read so the auto-backend is resolved
+    rc = mpl.rcParams
+    style = {key: rc._get(key) for key in rc}
+    style["backend"] = rc["backend"]
+    return style
 
 
 def apply_custom_style(style_dict: Dict[str, Any]) -> None:
@@ -247,4 +282,30 @@ def apply_custom_style(style_dict: Dict[str, Any]) -> None:
     >>> pp.rcParams['alpha'] = 0.2
     >>> pp.rcParams['hatch_mode'] = 3
     """
-    plt.rcParams.update(style_dict)
+    mpl.rcParams.update(style_dict)
+
+
+@contextmanager
+def apply_custom_style_scoped(style_dict: Dict[str, Any]) -> Iterator[None]:
+    """
+    Temporarily apply a custom style dictionary to matplotlib.
+
+    Context-manager version of apply_custom_style(): the rcParams are
+    applied in one batch via matplotlib.rc_context and restored on exit.
+    Only applies matplotlib rcParams.
+
+    Parameters
+    ----------
+    style_dict : Dict[str, Any]
+        Dictionary of matplotlib rcParams to apply within the block.
+
+    Examples
+    --------
+    Render a single figure with custom settings:
+    >>> import publiplots as pp
+    >>> from publiplots.themes import apply_custom_style_scoped
+    >>> with apply_custom_style_scoped({'font.size': 14}):
+    ...     fig, ax = pp.barplot(data=df, x='x', y='y')
+    """
+    with mpl.rc_context(style_dict):
+        yield
@@ -7,14 +7,17 @@ solid edge). The handlers automatically create legend markers that match the
 visual style of scatterplots and barplots.
 """
 
+from itertools import repeat
 from typing import List, Dict, Optional, Tuple, Any, Union
 
 from publiplots.themes.rcparams import resolve_param
 from matplotlib.axes import Axes
 from matplotlib.cm import ScalarMappable
 from matplotlib.colorbar import Colorbar
+from matplotlib.colors import to_rgba
 from matplotlib.legend import Legend
 from matplotlib.legend_handler import HandlerBase, HandlerPatch
+from matplotlib.lines import Line2D
 from matplotlib.patches import Circle, Rectangle, Patch
 import matplotlib.pyplot as plt
 
@@ -36,8 +39,15 @@ class MarkerPatch(Patch):
     Embeds marker symbol and markersize properties.
     """
     def __init__(self, marker='o', **kwargs):
-        markersize = kwargs.pop("markersize", resolve_param("lines.markersize"))
-        markeredgewidth = kwargs.pop("markeredgewidth", resolve_param("lines.markeredgewidth"))
+        # Only consult rcParams for properties that were not passed
+        markersize = (
+            kwargs.pop("markersize") if "markersize" in kwargs
+            else resolve_param("lines.markersize")
+        )
+        markeredgewidth = (
+            kwargs.pop("markeredgewidth") if "markeredgewidth" in kwargs
+            else resolve_param("lines.markeredgewidth")
+        )
         self.marker = marker
         self.markersize = markersize
         self.markeredgewidth = markeredgewidth
@@ -72,8 +82,15 @@ class LineMarkerPatch(Patch):
     Embeds marker symbol, markersize, linestyle, and all styling properties.
     """
     def __init__(self, marker='o', linestyle=None, **kwargs):
-        markersize = kwargs.pop("markersize", resolve_param("lines.markersize"))
-        markeredgewidth = kwargs.pop("markeredgewidth", resolve_param("lines.markeredgewidth"))
+        # Only consult rcParams for properties that were not passed
+        markersize = (
+            kwargs.pop("markersize") if "markersize" in kwargs
+            else resolve_param("lines.markersize")
+        )
+        markeredgewidth = (
+            kwargs.pop("markeredgewidth") if "markeredgewidth" in kwargs
+            else resolve_param("lines.markeredgewidth")
+        )
         self.marker = marker
         self.markersize = markersize
         self.markeredgewidth = markeredgewidth
@@ -183,35 +200,46 @@ class HandlerRectangle(HandlerPatch):
         Tuple[str, float, float, str, Optional[str]]
             (color, alpha, linewidth, edgecolor, hatch_pattern)
         """
-        # Defaults
-        color = "gray"
-        alpha = resolve_param("alpha", None)
-        linewidth = resolve_param("lines.linewidth", None)
+        # rcParams defaults are only resolved for properties the handle lacks
         edgecolor = None
-        hatch_pattern = None
 
-        # Extract from Patch
-        if hasattr(orig_handle, "get_facecolor"):
+        # Handle tuple format (color, hatch, alpha, linewidth)
+        if isinstance(orig_handle, tuple):
+            n_items = len(orig_handle)
+            color = orig_handle[0] if n_items >= 1 else "gray"
+            hatch_pattern = orig_handle[1] if n_items >= 2 else None
+            alpha = orig_handle[2] if n_items >= 3 else resolve_param("alpha")
+            linewidth = (
+                orig_handle[3] if n_items >= 4
+                else resolve_param("lines.linewidth")
+            )
+
+        # Extract from Patch (common case: no speculative attribute probing)
+        elif isinstance(orig_handle, Patch):
             color = orig_handle.get_facecolor()
-        if hasattr(orig_handle, "get_edgecolor"):
             edgecolor = orig_handle.get_edgecolor()
-        if hasattr(orig_handle, "get_alpha") and orig_handle.get_alpha() is not None:
             alpha = orig_handle.get_alpha()
-        if hasattr(orig_handle, "get_linewidth") and orig_handle.get_linewidth():
-            linewidth = orig_handle.get_linewidth()
-        if hasattr(orig_handle, "get_hatch"):
+            if alpha is None:
+                alpha = resolve_param("alpha")
+            linewidth = orig_handle.get_linewidth() or resolve_param("lines.linewidth")
             hatch_pattern = orig_handle.get_hatch()
 
-        # Handle tuple format (color, hatch, alpha, linewidth)
-        if isinstance(orig_handle, tuple):
-            if len(orig_handle) >= 1:
-                color = orig_handle[0]
-            if len(orig_handle) >= 2:
-                hatch_pattern = orig_handle[1]
-            if len(orig_handle) >= 3:
-                alpha = orig_handle[2]
-            if len(orig_handle) >= 4:
-                linewidth = orig_handle[3]
+        # Extract from any other artist exposing Patch-like getters
+        else:
+            color = "gray"
+            alpha = resolve_param("alpha")
+            linewidth = resolve_param("lines.linewidth")
+            hatch_pattern = None
+            if hasattr(orig_handle, "get_facecolor"):
+                color = orig_handle.get_facecolor()
+            if hasattr(orig_handle, "get_edgecolor"):
+                edgecolor = orig_handle.get_edgecolor()
+            if hasattr(orig_handle, "get_alpha") and orig_handle.get_alpha() is not None:
+                alpha = orig_handle.get_alpha()
+            if hasattr(orig_handle, "get_linewidth") and orig_handle.get_linewidth():
+                linewidth = orig_handle.get_linewidth()
+            if hasattr(orig_handle, "get_hatch"):
+                hatch_pattern = orig_handle.get_hatch()
 
         # Use face color as edge color if not specified
         if edgecolor is None:
@@ -220,6 +248,83 @@ class HandlerRectangle(HandlerPatch):
         return color, alpha, linewidth, edgecolor, hatch_pattern
 
 
+# =============================================================================
+# Marker Property Extractors
+# =============================================================================
+# Each extractor returns
+# (marker, color, size, alpha, linewidth, markeredgewidth, edgecolor)
+# and only falls back to rcParams for properties the handle does not carry.
+
+def _marker_properties_from_marker_patch(orig_handle: MarkerPatch) -> Tuple:
+    """Extract marker properties from a MarkerPatch (create_legend_handles)."""
+    color = orig_handle.get_facecolor()
+    edgecolor = orig_handle.get_edgecolor()
+    if edgecolor is None:
+        edgecolor = color
+    size = orig_handle.get_markersize()
+    if size is None:
+        size = resolve_param("lines.markersize")
+    alpha = orig_handle.get_alpha()
+    if alpha is None:
+        alpha = resolve_param("alpha")
+    linewidth = orig_handle.get_linewidth() or resolve_param("lines.linewidth")
+    return (
+        orig_handle.get_marker(), color, size, alpha, linewidth,
+        orig_handle.get_markeredgewidth(), edgecolor,
+    )
+
+
+def _marker_properties_from_line2d(orig_handle: Line2D) -> Tuple:
+    """Extract marker properties from a standard matplotlib Line2D."""
+    color = orig_handle.get_color() or orig_handle.get_markerfacecolor()
+    size = orig_handle.get_markersize() or resolve_param("lines.markersize")
+    linewidth = resolve_param("lines.linewidth")
+    markeredgewidth = orig_handle.get_markeredgewidth() or linewidth
+    # Line2D doesn't store alpha separately - use default; edge uses face color
+    return (
+        orig_handle.get_marker() or 'o', color, size, resolve_param("alpha"),
+        linewidth, markeredgewidth, color,
+    )
+
+
+def _marker_properties_default(orig_handle: Any) -> Tuple:
+    """Default marker properties for handles without marker information."""
+    return (
+        'o', "gray", resolve_param("lines.markersize"), resolve_param("alpha"),
+        resolve_param("lines.linewidth"), resolve_param("lines.markeredgewidth"),
+        "gray",
+    )
+
+
+# Handle type -> marker property extractor, used by HandlerMarker
+_MARKER_EXTRACTORS: Dict[type, Any] = {
+    MarkerPatch: _marker_properties_from_marker_patch,
+    Line2D: _marker_properties_from_line2d,
+}
+# Resolved extractor per concrete handle type, filled on first use
+_MARKER_EXTRACTOR_CACHE: Dict[type, Any] = {}
+
+
+def _lookup_marker_extractor(handle_type: type) -> Any:
+    """
+    Return the marker property extractor for a handle type.
+
+    Subclasses are resolved through the MRO against _MARKER_EXTRACTORS once
+    and memoized in _MARKER_EXTRACTOR_CACHE; handles without a registered
+    base get the default properties.
+    """
+    try:
+        return _MARKER_EXTRACTOR_CACHE[handle_type]
+    except KeyError:
+        extractor = next(
+            (_MARKER_EXTRACTORS[cls] for cls in handle_type.__mro__
+             if cls in _MARKER_EXTRACTORS),
+            _marker_properties_default,
+        )
+        _MARKER_EXTRACTOR_CACHE[handle_type] = extractor
+        return extractor
+
+
 class HandlerMarker(HandlerBase):
     """
     Generic legend handler for any matplotlib marker type.
@@ -243,9 +348,6 @@ class HandlerMarker(HandlerBase):
         trans: Any
     ) -> List:
         """Create the legend marker artists."""
-        from matplotlib.lines import Line2D
-        from matplotlib.colors import to_rgba
-
         # Center point for the marker
         cx = 0.5 * width - 0.5 * xdescent
         cy = 0.5 * height - 0.5 * ydescent
@@ -274,50 +376,16 @@ class HandlerMarker(HandlerBase):
         self,
         orig_handle: Any,
         fontsize: float
-    ) -> Tuple[str, str, float, float, float, str]:
+    ) -> Tuple[str, str, float, float, float, float, str]:
         """
         Extract all properties from the handle.
 
         Returns
         -------
-        Tuple[str, str, float, float, float, str]
-            (marker, color, size, alpha, linewidth, edgecolor)
+        Tuple[str, str, float, float, float, float, str]
+            (marker, color, size, alpha, linewidth, markeredgewidth, edgecolor)
         """
-        from matplotlib.lines import Line2D
-
-        # Defaults
-        marker = 'o'
-        color = "gray"
-        size = resolve_param("lines.markersize")
-        alpha = resolve_param("alpha")
-        linewidth = resolve_param("lines.linewidth")
-        markeredgewidth = resolve_param("lines.markeredgewidth")
-        edgecolor = None
-
-        # Extract from MarkerPatch (created by create_legend_handles)
-        if isinstance(orig_handle, MarkerPatch):
-            marker = orig_handle.get_marker()
-            color = orig_handle.get_facecolor()
-            edgecolor = orig_handle.get_edgecolor()
-            alpha = orig_handle.get_alpha() if orig_handle.get_alpha() is not None else alpha
-            linewidth = orig_handle.get_linewidth() if orig_handle.get_linewidth() else linewidth
-            size = orig_handle.get_markersize() if orig_handle.get_markersize() is not None else size
-            markeredgewidth = orig_handle.get_markeredgewidth()
-
-        # Extract from Line2D (standard matplotlib)
-        elif isinstance(orig_handle, Line2D):
-            marker = orig_handle.get_marker() or 'o'
-            color = orig_handle.get_color() or orig_handle.get_markerfacecolor()
-            size = orig_handle.get_markersize() or size
-            markeredgewidth = orig_handle.get_mairkeredgewidth() or linewidth
-            # Line2D doesn't store alpha separately - use default
-            # edgecolor will default to face color below
-
-        # Use face color as edge color if not specified
-        if edgecolor is None:
-            edgecolor = color
-
-        return marker, color, size, alpha, linewidth, markeredgewidth, edgecolor
+        return _lookup_marker_extractor(type(orig_handle))(orig_handle)
 
 
 class HandlerLineMarker(HandlerBase):
@@ -344,9 +412,6 @@ class HandlerLineMarker(HandlerBase):
         trans: Any
     ) -> List:
         """Create the legend line+marker artists."""
-        from matplotlib.lines import Line2D
-        from matplotlib.colors import to_rgba
-
         # Extract all properties from the handle
         marker, color, size, alpha, linewidth, markeredgewidth, edgecolor, linestyle = self._extract_properties(
             orig_handle, fontsize
@@ -361,41 +426,46 @@ class HandlerLineMarker(HandlerBase):
         marker_x = 0.5 * width - 0.5 * xdescent
         marker_y = line_y
 
+        # Opaque color is shared by the line and the marker edge
+        opaque_color = to_rgba(color, 1.0)
+
         # Create the connecting line
         line = Line2D(
             [line_x_start, line_x_end],
             [line_y, line_y],
-            color=to_rgba(color, 1.0),
+            color=opaque_color,
             linewidth=linewidth,
             linestyle=linestyle,
             transform=trans,
             zorder=1
         )
 
+        # Properties shared by both marker layers
+        marker_kwargs = {
+            "marker": marker,
+            "markersize": size,
+            "linestyle": 'none',
+            "transform": trans,
+        }
+
         # Layer 1: White background marker (covers the line)
         marker_background = Line2D(
             [marker_x], [marker_y],
-            marker=marker,
-            markersize=size,
             markerfacecolor='white',
             markeredgecolor=color,
             markeredgewidth=0,
-            linestyle='none',
-            transform=trans,
-            zorder=2
+            zorder=2,
+            **marker_kwargs
         )
 
         # Layer 2: Semi-transparent filled marker
         marker_artist = Line2D(
             [marker_x], [marker_y],
-            marker=marker,
-            markersize=size,
             markerfacecolor=to_rgba(color, alpha),
-            markeredgecolor=to_rgba(color, 1.0),
+            markeredgecolor=opaque_color,
             markeredgewidth=markeredgewidth,
-            linestyle='none',
-            transform=trans,
-            zorder=3
+            zorder=3,
+            **marker_kwargs
         )
 
         return [line, marker_background, marker_artist]
@@ -413,43 +483,45 @@ class HandlerLineMarker(HandlerBase):
         Tuple[str, str, float, float, float, str, str]
             (marker, color, size, alpha, linewidth, edgecolor, linestyle)
         """
-        from matplotlib.lines import Line2D
-
-        # Defaults
-        marker = 'o'
-        color = "gray"
-        size = resolve_param("lines.markersize")
-        alpha = resolve_param("alpha")
-        linewidth = resolve_param("lines.linewidth")
-        markeredgewidth = resolve_param("lines.markeredgewidth")
+        # rcParams defaults are only resolved for properties the handle lacks
         edgecolor = None
-        linestyle = None
 
         # Extract from LineMarkerPatch (created by create_legend_handles)
         if isinstance(orig_handle, LineMarkerPatch):
             marker = orig_handle.get_marker()
             color = orig_handle.get_facecolor()
             edgecolor = orig_handle.get_edgecolor()
-            alpha = orig_handle.get_alpha() if orig_handle.get_alpha() is not None else alpha
+            alpha = orig_handle.get_alpha()
+            if alpha is None:
+                alpha = resolve_param("alpha")
             linestyle = orig_handle.get_linestyle()
             linewidth = orig_handle.get_linewidth()
             markeredgewidth = orig_handle.get_markeredgewidth()
             # Use actual markersize from patch (already in correct units)
-            patch_size = orig_handle.get_markersize()
-            if patch_size is not None:
-                size = patch_size
+            size = orig_handle.get_markersize()
+            if size is None:
+                size = resolve_param("lines.markersize")
 
         # Extract from Line2D (standard matplotlib - fallback)
         elif isinstance(orig_handle, Line2D):
-            marker = orig_handle.get_marker() or marker
+            marker = orig_handle.get_marker() or 'o'
             linestyle = orig_handle.get_linestyle()
             color = orig_handle.get_color() or orig_handle.get_markerfacecolor()
-            line_size = orig_handle.get_markersize()
-            if line_size:
-                size = line_size
+            size = orig_handle.get_markersize() or resolve_param("lines.markersize")
             linewidth = orig_handle.get_linewidth()
+            markeredgewidth = resolve_param("lines.markeredgewidth")
             # Line2D doesn't store alpha separately - use default
             # edgecolor will default to face color below
+            alpha = resolve_param("alpha")
+
+        else:
+            marker = 'o'
+            color = "gray"
+            size = resolve_param("lines.markersize")
+            alpha = resolve_param("alpha")
+            linewidth = resolve_param("lines.linewidth")
+            markeredgewidth = resolve_param("lines.markeredgewidth")
+            linestyle = None
 
         # Use face color as edge color if not specified
         if edgecolor is None:
@@ -463,6 +535,19 @@ class HandlerLineMarker(HandlerBase):
 # =============================================================================
 
 
+# Handlers are stateless, so a single instance of each is shared
+_HANDLER_RECTANGLE = HandlerRectangle()
+_HANDLER_MARKER = HandlerMarker()
+_HANDLER_LINE_MARKER = HandlerLineMarker()
+
+_DEFAULT_HANDLER_MAP: Dict[type, HandlerBase] = {
+    Rectangle: _HANDLER_RECTANGLE,
+    MarkerPatch: _HANDLER_MARKER,
+    LineMarkerPatch: _HANDLER_LINE_MARKER,
+    Patch: _HANDLER_RECTANGLE,
+}
+
+
 def get_legend_handler_map() -> Dict[type, HandlerBase]:
     """
     Get a handler map for automatic legend styling.
@@ -470,18 +555,11 @@ def get_legend_handler_map() -> Dict[type, HandlerBase]:
     Returns
     -------
     Dict[type, HandlerBase]
-        Dictionary mapping matplotlib types to handler instances.
+        Dictionary mapping matplotlib types to handler instances. The
+        handler instances are shared; the dict itself is a fresh copy
+        that can be safely modified.
     """
-    handler_rectangle = HandlerRectangle()
-    handler_marker = HandlerMarker()
-    handler_line_marker = HandlerLineMarker()
-
-    return {
-        Rectangle: handler_rectangle,
-        MarkerPatch: handler_marker,
-        LineMarkerPatch: handler_line_marker,
-        Patch: handler_rectangle,
-    }
+    return _DEFAULT_HANDLER_MAP.copy()
 
 def create_legend_handles(
     labels: List[str],
@@ -533,6 +611,10 @@ def create_legend_handles(
     List[Patch]
         List of Patch objects with embedded properties.
     """
+    # Nothing to build (e.g. no categorical variable is mapped)
+    if len(labels) == 0:
+        return []
+
     # Read defaults from rcParams if not provided
     alpha = resolve_param("alpha", alpha)
     linewidth = resolve_param("lines.linewidth", linewidth)
@@ -559,69 +641,45 @@ def create_legend_handles(
         linestyles = linestyles or [resolve_param("lines.linestyle")]
         linestyles = [linestyles[i % len(linestyles)] for i in range(len(labels))]
 
-    handles = []
-
-    # Determine patch type
+    # Resolve the handle class and its shared/per-entry properties once,
+    # so the loop below only builds the handles
+    common_kwargs = {"alpha": alpha, "linewidth": linewidth}
     if markers is not None and linestyles is not None:
         # Use LineMarkerPatch when both markers and linestyles are specified
-        for label, col, size, marker, linestyle in zip(labels, colors, sizes, markers, linestyles):
-            handle = LineMarkerPatch(
-                marker=marker,
-                linestyle=linestyle,
-                facecolor=col,
-                edgecolor=col,
-                alpha=alpha,
-                linewidth=linewidth,
-                label=label,
-                markersize=size,
-                markeredgewidth=markeredgewidth,
-            )
-            handles.append(handle)
+        patch_cls = LineMarkerPatch
+        extra_keys = ("marker", "linestyle")
+        extra_values = zip(markers, linestyles)
+        common_kwargs["markeredgewidth"] = markeredgewidth
     elif markers is not None:
         # Use MarkerPatch when only markers are specified
-        for label, col, hatch, size, marker in zip(labels, colors, hatches, sizes, markers):
-            handle = MarkerPatch(
-                marker=marker,
-                facecolor=col,
-                edgecolor=col,
-                alpha=alpha,
-                linewidth=linewidth,
-                label=label,
-                markersize=size,
-                markeredgewidth=markeredgewidth,
-            )
-            handles.append(handle)
+        patch_cls = MarkerPatch
+        extra_keys = ("marker",)
+        extra_values = zip(markers)
+        common_kwargs["markeredgewidth"] = markeredgewidth
+    elif style == "circle":
+        # Circle is just a marker with 'o' symbol
+        patch_cls = MarkerPatch
+        extra_keys = ()
+        extra_values = repeat(())
+        common_kwargs["marker"] = "o"
+        common_kwargs["markeredgewidth"] = markeredgewidth
     else:
-        # Use MarkerPatch for circles, RectanglePatch for rectangles
-        if style == "circle":
-            # Circle is just a marker with 'o' symbol
-            for label, col, hatch, size in zip(labels, colors, hatches, sizes):
-                handle = MarkerPatch(
-                    marker='o',
-                    facecolor=col,
-                    edgecolor=col,
-                    alpha=alpha,
-                    linewidth=linewidth,
-                    label=label,
-                    markersize=size,
-                    markeredgewidth=markeredgewidth,
-                )
-                handles.append(handle)
-        else:
-            # Rectangle patches (for bar plots with hatches)
-            for label, col, hatch, size in zip(labels, colors, hatches, sizes):
-                handle = RectanglePatch(
-                    facecolor=col,
-                    edgecolor=col,
-                    alpha=alpha,
-                    linewidth=linewidth,
-                    label=label,
-                    hatch=hatch,
-                    markersize=size,
-                )
-                handles.append(handle)
-
-    return handles
+        # Rectangle patches (for bar plots with hatches)
+        patch_cls = RectanglePatch
+        extra_keys = ("hatch",)
+        extra_values = zip(hatches)
+
+    return [
+        patch_cls(
+            facecolor=col,
+            edgecolor=col,
+            label=label,
+            markersize=size,
+            **common_kwargs,
+            **dict(zip(extra_keys, values)),
+        )
+        for label, col, size, values in zip(labels, colors, sizes, extra_values)
+    ]
 
 
 # =============================================================================
@@ -658,6 +716,7 @@ class LegendBuilder:
         self.current_y = bbox_to_anchor[1]
         self.spacing = spacing
         self.elements = []
+        self._legends: List[Legend] = []
 
     def add_legend(
         self,
@@ -698,18 +757,21 @@ class LegendBuilder:
             "borderpad": 0,
             "handletextpad": 0.5,
             "labelspacing": 0.3,
-            "handler_map": kwargs.pop("handler_map", get_legend_handler_map()),
+            "handler_map": kwargs.pop("handler_map", _DEFAULT_HANDLER_MAP),
             "alignment": "left",
         }
         default_kwargs.update(kwargs)
         
-        existing_legends = [e[1] for e in self.elements if e[0] == "legend"]
+        # ax.legend() replaces ax.legend_; only the legend it displaces needs
+        # to be kept as a plain artist (older ones already are)
+        previous_legend = self._legends[-1] if self._legends else None
         leg = self.ax.legend(handles=handles, **default_kwargs)
         leg.set_clip_on(False)
         
-        for existing_legend in existing_legends:
-            self.ax.add_artist(existing_legend)
+        if previous_legend is not None:
+            self.ax.add_artist(previous_legend)
 
+        self._legends.append(leg)
         self.elements.append(("legend", leg))
         self._update_position_after_legend(leg)
         
@@ -768,10 +830,8 @@ class LegendBuilder:
                 fontweight="normal"
             )
             
-            # Force draw to measure title height
-            self.fig.canvas.draw()
-            
             # Get title bounding box in axes coordinates
+            self._apply_layout()
             bbox = title_text.get_window_extent(self.fig.canvas.get_renderer())
             bbox_axes = bbox.transformed(self.ax.transAxes.inverted())
             title_height = bbox_axes.height
@@ -812,12 +872,21 @@ class LegendBuilder:
         
         return cbar
     
+    def _apply_layout(self):
+        """
+        Run the figure's layout engine, if any, before measuring artists.
+
+        Constrained/tight layout moves the axes at draw time, so extents
+        measured without it place stacked elements relative to a stale
+        axes position.
+        """
+        if self.fig.get_layout_engine() is not None:
+            self.fig.draw_without_rendering()
+
     def _update_position_after_legend(self, legend: Legend):
         """Update current_y position after adding a legend."""
-        # Force draw to get actual size
-        self.fig.canvas.draw()
-        
         # Get legend bounding box
+        self._apply_layout()
         bbox = legend.get_window_extent(self.fig.canvas.get_renderer())
         bbox_axes = bbox.transformed(self.ax.transAxes.inverted())
         height = bbox_axes.height
@@ -849,24 +918,19 @@ class LegendBuilder:
         legend_data = _get_legend_data(self.ax)
 
         if legend_data and type in legend_data:
-            # Use stored metadata
-            data = legend_data[type].copy()
+            # Use stored metadata, merged with overrides into a single new dict
+            data = legend_data[type]
+            label_override = {'label': label} if label is not None else {}
+            merged_kwargs = {**data, **label_override, **kwargs}
 
             # Check if this is a colorbar
             if data.get('type') == 'colorbar':
-                # Handle colorbar
-                if label is not None:
-                    data['label'] = label
-                data.update(kwargs)
                 # Remove 'type' key as it's not a parameter for add_colorbar
-                data.pop('type', None)
-                self.add_colorbar(**data)
+                merged_kwargs.pop('type', None)
+                self.add_colorbar(**merged_kwargs)
             else:
                 # Handle regular legend
-                if label is not None:
-                    data['label'] = label
-                data.update(kwargs)
-                self.add_legend(**data)
+                self.add_legend(**merged_kwargs)
         else:
             # Fallback: basic auto-detection
             # This is a simple fallback - may not work for complex cases
@@ -877,6 +941,24 @@ class LegendBuilder:
         return max(0, self.current_y)
 
 
+def _attach_legend_data(ax: Axes, artist: Any, legend_data: dict) -> None:
+    """
+    Store legend data on an artist and record it as the axes' owner.
+
+    Parameters
+    ----------
+    ax : Axes
+        Axes the artist belongs to.
+    artist : Artist
+        Artist to store the legend data on.
+    legend_data : dict
+        Legend data for 'hue', 'size', 'style'.
+    """
+    artist._legend_data = legend_data
+    # Remember the owning artist so legend() can skip the artist scan
+    ax._pp_legend_artist = artist
+
+
 def _get_legend_data(ax: Axes) -> dict:
     """
     Get stored legend data from axes collections/patches/lines.
@@ -891,6 +973,13 @@ def _get_legend_data(ax: Axes) -> dict:
     dict
         Dictionary with legend data for 'hue', 'size', 'style' if available
     """
+    # Fast path: artist recorded by the plotting function. Removed/cleared
+    # artists have their ``axes`` reset to None, so this never goes stale.
+    artist = getattr(ax, "_pp_legend_artist", None)
+    if artist is not None and artist.axes is ax:
+        return artist._legend_data
+
+    # Fall back to scanning the artists (e.g. data attached by user code)
     # Check collections first
     for collection in ax.collections:
         if hasattr(collection, '_legend_data'):
@@ -973,10 +1062,6 @@ def legend(
     # Initialize LegendBuilder
     builder = LegendBuilder(ax, **builder_kwargs)
 
-    # Auto-apply handler_map if not provided
-    if 'handler_map' not in kwargs:
-        kwargs['handler_map'] = get_legend_handler_map()
-
     # Manual mode with handles
     if handles is not None:
         builder.add_legend(handles=handles, labels=labels, **kwargs)
@@ -986,20 +1071,20 @@ def legend(
     if auto:
         legend_data = _get_legend_data(ax)
         if legend_data:
+            # Stored metadata is only unpacked, never mutated, so no copies
             if 'hue' in legend_data:
-                hue_data = legend_data['hue'].copy()
+                hue_data = legend_data['hue']
                 # Check if it's a colorbar
                 if hue_data.get('type') == 'colorbar':
-                    hue_data.pop('type', None)
-                    builder.add_colorbar(**hue_data)
+                    builder.add_colorbar(
+                        **{k: v for k, v in hue_data.items() if k != 'type'}
+                    )
                 else:
                     builder.add_legend(**hue_data, **kwargs)
             if 'size' in legend_data:
-                size_data = legend_data['size'].copy()
-                builder.add_legend(**size_data, **kwargs)
+                builder.add_legend(**legend_data['size'], **kwargs)
             if 'style' in legend_data:
-                style_data = legend_data['style'].copy()
-                builder.add_legend(**style_data, **kwargs)
+                builder.add_legend(**legend_data['style'], **kwargs)
 
     # If auto=False, just return empty builder for manual control
     return builder
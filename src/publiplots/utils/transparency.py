@@ -9,10 +9,10 @@ distinctive publiplots style of transparent fill with opaque edges.
 from matplotlib.collections import PathCollection, FillBetweenPolyCollection
 from matplotlib.lines import Line2D
 from matplotlib.patches import Patch
-from matplotlib.colors import to_rgba
+from matplotlib.colors import to_rgba, to_rgba_array
 from matplotlib.axes import Axes
 import numpy as np
-from typing import Union, Sequence, Optional, List
+from typing import Callable, Dict, Union, Sequence, Optional, List
 
 
 class ArtistTracker:
@@ -144,16 +144,16 @@ def apply_transparency(
     Examples
     --------
     Apply transparency to scatter plot:
-    >>> import publiplots as pp
+    >>> from publiplots.utils import apply_transparency
     >>> import seaborn as sns
     >>> fig, ax = plt.subplots()
     >>> sns.scatterplot(data=df, x='x', y='y', ax=ax)
-    >>> pp.apply_edge_transparency(ax.collections[0], face_alpha=0.1)
+    >>> apply_transparency(ax.collections[0], face_alpha=0.1)
 
     Apply transparency to bar plot:
     >>> fig, ax = plt.subplots()
     >>> sns.barplot(data=df, x='category', y='value', ax=ax)
-    >>> pp.apply_edge_transparency(ax.patches, face_alpha=0.2)
+    >>> apply_transparency(ax.patches, face_alpha=0.2)
 
     Notes
     -----
@@ -162,17 +162,21 @@ def apply_transparency(
     - Edge colors default to face colors if not explicitly set
     - Original color values are preserved, only alpha is modified
     """
-    if isinstance(artists, PathCollection) or isinstance(artists, FillBetweenPolyCollection):
-        _apply_to_collection(artists, face_alpha, edge_alpha)
-    elif hasattr(artists, '__iter__') and not isinstance(artists, (str, PathCollection)):
-        # It's a sequence - check first element type
-        artists_list = list(artists)
+    handler = _lookup_handler(
+        _COLLECTION_HANDLERS, _COLLECTION_HANDLER_CACHE, type(artists)
+    )
+    if handler is not None:
+        handler(artists, face_alpha, edge_alpha)
+    elif hasattr(artists, '__iter__') and not isinstance(artists, str):
+        # It's a sequence - check first element type (lists are used as-is)
+        artists_list = artists if isinstance(artists, list) else list(artists)
         if len(artists_list) == 0:
             return
-        if isinstance(artists_list[0], Line2D):
-            _apply_to_lines(artists_list, face_alpha, edge_alpha)
-        elif isinstance(artists_list[0], Patch):
-            _apply_to_patches(artists_list, face_alpha, edge_alpha)
+        handler = _lookup_handler(
+            _ELEMENT_HANDLERS, _ELEMENT_HANDLER_CACHE, type(artists_list[0])
+        )
+        if handler is not None:
+            handler(artists_list, face_alpha, edge_alpha)
 
 
 def _apply_to_collection(
@@ -203,16 +207,54 @@ def _apply_to_collection(
         face_colors = edge_colors
 
     # Now apply different alpha to face
-    new_face_colors = np.array([
-        to_rgba(c, alpha=face_alpha) for c in face_colors
-    ])
-    collection.set_facecolors(new_face_colors)
+    face_rgba = _with_alpha(face_colors, face_alpha)
+
+    collection.set_facecolors(face_rgba)
+
+    # Edges that are their own, already-opaque RGBA array are left untouched
+    # for edge_alpha=1. Edges aliasing the faces (edgecolor='face', or unset)
+    # must still be set, or they would follow the new face alpha.
+    if (
+        edge_alpha == 1.0
+        and edge_colors is not face_colors
+        and _is_rgba_array(edge_colors)
+        and (edge_colors[:, 3] == 1.0).all()
+    ):
+        return
+
+    # Now apply different alpha to edge; when both sides share their source
+    # colors and alpha the face array is reused (the setters copy it)
+    if edge_colors is face_colors and edge_alpha == face_alpha:
+        edge_rgba = face_rgba
+    else:
+        edge_rgba = _with_alpha(edge_colors, edge_alpha)
+
+    collection.set_edgecolors(edge_rgba)
+
+
+def _is_rgba_array(colors) -> bool:
+    """Return True if colors is an (n, 4) float RGBA array."""
+    return (
+        isinstance(colors, np.ndarray)
+        and colors.ndim == 2
+        and colors.shape[1] == 4
+        and colors.dtype.kind == "f"
+    )
+
+
+def _with_alpha(colors, alpha: float) -> np.ndarray:
+    """
+    Return colors as an (n, 4) RGBA array with the alpha channel replaced.
 
-    # Now apply different alpha to edge
-    new_edge_colors = np.array([
-        to_rgba(c, alpha=edge_alpha) for c in edge_colors
-    ])
-    collection.set_edgecolors(new_edge_colors)
+    Collections store their colors as float RGBA arrays already; those only
+    need their alpha column overwritten on a copy. Anything else is parsed
+    with the vectorized ``to_rgba_array``.
+    """
+    if _is_rgba_array(colors):
+        rgba = colors.copy()
+        rgba[:, 3] = alpha
+        return rgba
+    return to_rgba_array(colors, alpha=alpha)
 
 
 def _apply_to_lines(
@@ -232,13 +274,25 @@ def _apply_to_lines(
     edge_alpha : float
         Alpha for marker edge colors.
     """
+    # Resolve each distinct color once: boxplots/swarmplots produce many
+    # lines sharing a handful of group colors
+    resolved = {}
     for line in lines:
-        color = line.get_color()
-        if line.get_marker() and line.get_marker() != 'None':
-            line.set_markerfacecolor(to_rgba(color, alpha=face_alpha))
-            line.set_markeredgecolor(to_rgba(color, alpha=edge_alpha))
+        key = _color_key(line.get_color())
+        rgba = resolved.get(key)
+        if rgba is None:
+            rgba = resolved[key] = (
+                to_rgba(key, alpha=face_alpha),
+                to_rgba(key, alpha=edge_alpha),
+            )
+        face_rgba, edge_rgba = rgba
+
+        marker = line.get_marker()
+        if marker and marker != 'None':
+            line.set_markerfacecolor(face_rgba)
+            line.set_markeredgecolor(edge_rgba)
         else:
-            line.set_color(to_rgba(color, alpha=edge_alpha))
+            line.set_color(edge_rgba)
 
 def _apply_to_patches(
     patches: Sequence[Patch],
@@ -257,11 +311,12 @@ def _apply_to_patches(
     edge_alpha : float
         Alpha for edge colors.
     """
-    for patch in patches:
-        if not hasattr(patch, 'get_edgecolor'):
-            # Skip non-patch artists
-            continue
-
+    # Resolve each distinct color once: bar plots reuse a few group colors
+    face_resolved = {}
+    # Equal alphas give identical results for a color: share one table
+    edge_resolved = face_resolved if edge_alpha == face_alpha else {}
+    # Skip non-patch artists (filtered once up front)
+    for patch in [p for p in patches if isinstance(p, Patch)]:
         # Get current edge color
         edge_color = patch.get_edgecolor()
         face_color = patch.get_facecolor()
@@ -273,8 +328,68 @@ def _apply_to_patches(
             edge_color = face_color
 
         # Now apply different alpha to face and edge
-        patch.set_facecolor(to_rgba(face_color, alpha=face_alpha))
-        patch.set_edgecolor(to_rgba(edge_color, alpha=edge_alpha))
+        face_key = _color_key(face_color)
+        face_rgba = face_resolved.get(face_key)
+        if face_rgba is None:
+            face_rgba = face_resolved[face_key] = to_rgba(face_key, alpha=face_alpha)
+        edge_key = _color_key(edge_color)
+        edge_rgba = edge_resolved.get(edge_key)
+        if edge_rgba is None:
+            edge_rgba = edge_resolved[edge_key] = to_rgba(edge_key, alpha=edge_alpha)
+        patch.set_facecolor(face_rgba)
+        patch.set_edgecolor(edge_rgba)
+
+
+def _color_key(color):
+    """
+    Return a hashable form of a single color.
+
+    RGB(A) arrays and lists become tuples, so they can key a dict and hit
+    matplotlib's own (color, alpha) cache in ``to_rgba`` instead of being
+    re-parsed on every call. Other colors are returned unchanged.
+    """
+    if isinstance(color, np.ndarray):
+        color = color.tolist()
+    if isinstance(color, list):
+        return tuple(color)
+    return color
+
+
+# Artist type -> transparency handler, used by apply_transparency
+_COLLECTION_HANDLERS: Dict[type, Callable] = {
+    PathCollection: _apply_to_collection,
+    FillBetweenPolyCollection: _apply_to_collection,
+}
+_ELEMENT_HANDLERS: Dict[type, Callable] = {
+    Line2D: _apply_to_lines,
+    Patch: _apply_to_patches,
+}
+# Resolved handler (or None) per concrete artist type, filled on first use
+_COLLECTION_HANDLER_CACHE: Dict[type, Optional[Callable]] = {}
+_ELEMENT_HANDLER_CACHE: Dict[type, Optional[Callable]] = {}
+
+
+def _lookup_handler(
+    handlers: Dict[type, Callable],
+    cache: Dict[type, Optional[Callable]],
+    artist_type: type,
+) -> Optional[Callable]:
+    """
+    Return the handler for an artist type, or None if it has none.
+
+    Subclasses are resolved through the MRO against handlers once and
+    memoized in cache, misses included, so unsupported types (lists,
+    ArtistList, tuples) are not re-walked on every call.
+    """
+    try:
+        return cache[artist_type]
+    except KeyError:
+        handler = next(
+            (handlers[cls] for cls in artist_type.__mro__ if cls in handlers),
+            None,
+        )
+        cache[artist_type] = handler
+        return handler
 
 
 __all__ = [